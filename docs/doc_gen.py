@@ -1,21 +1,105 @@
 from copy import copy
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import sha256
+from itertools import repeat
+from os import scandir
+import pickle
 import re
-from typing import Dict, List, Union, Tuple
+from typing import Dict, List, Union, Tuple, Optional, Set
 from subprocess import call, DEVNULL
 from pathlib import Path
 from shutil import rmtree, copyfile
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import ElementTree, Element
-from markdown import markdown
-
-
+from markdown import Markdown, __version__ as markdown_version
+
+
+_RE_ASSEMBLY_VERSION = re.compile(r'^\[assembly: AssemblyVersion\("(.*?)"\)\]', flags=re.MULTILINE)
+_RE_CODE_EXAMPLE = re.compile(r"{code_example:(.*?)}")
+_RE_SNAKE = re.compile(r'(?<!^)(?=[A-Z])')
+_RE_CLI_CODE = re.compile(r'<p><code>(.*?)</code></p>')
+_RE_CLI_PYTHON = re.compile(r'```python\n((.|\n)*?)```')
+# Matches a paragraph break or a lone line break; both become a paragraph break for Markdown.
+_RE_LINE_BREAK = re.compile(r"\n\n?")
+_RE_PARAGRAPH_TAG = re.compile(r"</?p>")
+_RE_MARKDOWN_BLOCK_START = re.compile(r"^(?:(?:[-+]|\d+[.)])(?:\s|$)|--)")
+_MARKDOWN_CHARACTERS = frozenset("*_`[]<>&#\\\n\r\t")
+_XML_DIRECTORY = Path("xml").resolve()
+_CLATTER_DIRECTORY = Path("../Clatter").resolve()
+_CODE_EXAMPLES_DIRECTORY = _CLATTER_DIRECTORY.joinpath("doc_code_examples")
+# Parsed classes and overview HTML from previous runs.
+_CACHE_DIRECTORY = Path("doc_cache").resolve()
+# The suffix of an HTML page.
+_HTML_SUFFIX = "</div></div></div></body></html>"
+# Reused Markdown converters. Call reset() before each conversion.
+_MARKDOWN = Markdown()
+_MARKDOWN_TABLES = Markdown(extensions=['markdown.extensions.tables'])
+# HTML table headers.
+_ENUM_VALUES_TABLE_HEADER = "<table>\n\t<tr>\n\t\t<th><strong>Value</strong></th>\n\t</tr>\n"
+_ENUM_DESCRIPTIONS_TABLE_HEADER = "<table>\n\t<tr>\n\t\t<th><strong>Value</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t</tr>\n"
+_PARAMETERS_TABLE_HEADER = "<table>\n\t<tr>\n\t\t<th><strong>Name</strong></th><th>\n\t\t<strong>Type</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t</tr>\n"
+_PROPERTIES_TABLE_HEADER = "<table>\n\t<tr>\n\t\t<th><strong>Name</strong></th><th>\n\t\t<strong>Type</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t\t<th><strong>Get/Set</strong></th>\n\t</tr>\n"
+_FIELDS_TABLE_HEADER = "<table>\n\t<tr>\n\t\t<th><strong>Name</strong></th><th>\n\t\t<strong>Type</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t\t<th><strong>Default Value</strong></th>\n\t</tr>\n"
+
+
+@lru_cache(maxsize=None)
 def get_version() -> str:
     """
     :return: The version number of Clatter.Core.
     """
 
-    assembly_info: str = Path("../Clatter/Clatter.Core/Properties/AssemblyInfo.cs").read_text(encoding="utf-8")
-    return re.search(r'^\[assembly: AssemblyVersion\("(.*?)"\)\]', assembly_info, flags=re.MULTILINE).group(1)
+    assembly_info: str = _CLATTER_DIRECTORY.joinpath("Clatter.Core/Properties/AssemblyInfo.cs").read_text(encoding="utf-8")
+    return _RE_ASSEMBLY_VERSION.search(assembly_info).group(1)
+
+
+def get_internal_link(e: Element) -> Optional[str]:
+    """
+    :param e: An XML element.
+
+    :return: If this element is a class, struct, or enum name in backticks, the name. Otherwise, None.
+    """
+
+    if e.tag != "computeroutput" or e.text or len(e) != 1:
+        return None
+    ref: Element = e[0]
+    if ref.tag != "ref" or ref.get("kindref") != "compound" or ref.tail:
+        return None
+    return ref.text
+
+
+def get_description_text(e: Element, links: Set[str], text: List[str]) -> None:
+    """
+    Convert the contents of a Doxygen description element into Markdown.
+
+    :param e: The XML element.
+    :param links: The names of the classes, structs, and enums that should be converted into links.
+    :param text: A list of Markdown text. This will be appended to.
+    """
+
+    if e.text is not None:
+        text.append(e.text)
+    for child in e:
+        link: Optional[str] = get_internal_link(child)
+        # Doxygen automatically references other mentions of the name.
+        if link is None and child.tag == "ref" and child.get("kindref") == "compound" and child.text in links:
+            link = child.text
+        if link is not None:
+            text.append(f'[`{link}`]({link.split(".")[-1]}.html)')
+        # Link to an external URL.
+        elif child.tag == "ulink":
+            url: str = child.get("url")
+            text.append(get_text(child).replace(url, f'[{url.split("/")[-1]}]({url})'))
+        else:
+            # Generate a list.
+            if child.tag == "listitem":
+                text.append("- ")
+            get_description_text(child, links, text)
+        if child.tail is not None:
+            text.append(child.tail)
 
 
 def get_description(e: Element, is_paragraphs: bool, brief_description: bool = True, detailed_description: bool = True) -> str:
@@ -38,42 +122,52 @@ def get_description(e: Element, is_paragraphs: bool, brief_description: bool = T
     for desc in keys:
         de_el: Element = e.find(desc)
         if de_el is not None:
-            # Get the raw text to get internal links.
-            de_text_raw: str = ET.tostring(e.find(desc), encoding="utf-8", method="html").decode()
-            internal_links = re.findall(r'<computeroutput><ref kindref="compound" refid="(.*?)">(.*?)</ref></computeroutput>',
-                                        de_text_raw, flags=re.MULTILINE)
-            de_text: str = ET.tostring(e.find(desc), encoding="utf-8", method="text").decode()
-            # Generate a list.
-            if "<itemizedlist>" in de_text_raw:
-                itemized_list = re.search(r"<itemizedlist>((.|\n)*?)</itemizedlist>", de_text_raw, flags=re.MULTILINE).group(1)
-                list_items = re.findall(r"<listitem><para>(.*?)</para>[.|\n]</listitem>", itemized_list)
-                for lii in list_items:
-                    de_text = de_text.replace(lii.replace("<computeroutput>", "").replace("</computeroutput>", ""),
-                                              f"- {lii.strip()}")
-            lis = []
-            for link in internal_links:
-                li: str = link[1]
-                if li in lis:
-                    continue
-                lis.append(li)
-                de_text = re.sub(r"\b" + li + r"\b", f'[`{li}`]({li.split(".")[-1]}.html)', de_text, flags=re.MULTILINE)
-            external_links = re.findall(r'<ulink url="(.*?)">(.*?)</ulink>', de_text_raw, flags=re.MULTILINE)
-            for link in external_links:
-                li: str = link[0]
-                de_text = de_text.replace(li, f'[{li.split("/")[-1]}]({li})')
+            # Get the internal links.
+            links: Set[str] = {get_internal_link(c) for c in de_el.iter("computeroutput")}
+            links.discard(None)
+            de_text_parts: List[str] = list()
+            get_description_text(de_el, links, de_text_parts)
+            de_text: str = "".join(de_text_parts)
             if is_paragraphs:
-                de_text = markdown(de_text.strip().replace("\n\n", "%%").replace("\n", "\n\n").replace("%%", "\n\n"))
+                de_text = paragraphs_markdown(_RE_LINE_BREAK.sub("\n\n", de_text.strip()))
             else:
                 de_text = de_text.strip()
             descriptions.append(de_text)
     # Try to find an image.
-    raw_e = ET.tostring(e).decode()
-    if "png" in raw_e:
-        image_name = re.search(r'<image inline="\w+" name="(.*?)" type="\w+" />', raw_e).group(1)
-        descriptions.append(f'\n\n<p><img src="images/{image_name}" width="50%"></p>')
+    image: Element = e.find(".//image")
+    if image is not None:
+        image_name: str = image.attrib["name"]
+        if "png" in image_name:
+            descriptions.append(f'\n\n<p><img src="images/{image_name}" width="50%"></p>')
     return " ".join(descriptions)
 
 
+@lru_cache(maxsize=None)
+def get_code_example(name: str) -> str:
+    """
+    :param name: The name of the code example file, without the extension.
+
+    :return: The code example as an HTML code block.
+    """
+
+    code_example = _CODE_EXAMPLES_DIRECTORY.joinpath(f"{name}.cs").read_text(encoding="utf-8-sig")
+    return "<pre><code>" + code_example + "</code></pre>\n\n"
+
+
+def insert_code_example(match: re.Match) -> str:
+    """
+    :param match: A code_example tag match.
+
+    :return: The code example that replaces the tag.
+    """
+
+    code_example = get_code_example(match.group(1))
+    # Close the paragraph if there is more text after the code example.
+    if len(match.string[match.end():].strip()) > 0:
+        code_example = "</p>\n" + code_example + "<p>"
+    return code_example
+
+
 def get_description_and_code_examples(description: str) -> Tuple[str, str]:
     """
     Replace code_example tags in a description with actual code examples.
@@ -82,15 +176,7 @@ def get_description_and_code_examples(description: str) -> Tuple[str, str]:
     """
 
     # Add code examples.
-    while "code_example" in description:
-        match = re.search(r"{code_example:(.*?)}", description, flags=re.MULTILINE)
-        code_example_filename = match.group(1)
-        code_example = Path(f"../Clatter/doc_code_examples/{code_example_filename}.cs").resolve().read_text(encoding="utf-8-sig")
-        code_example = "<pre><code>" + code_example + "</code></pre>\n\n"
-        desc_split = description.split(match.group(0))
-        if len(desc_split[1].strip()) > 0:
-            code_example = "</p>\n" + code_example + "<p>"
-        description = description.replace(match.group(0), code_example)
+    description = _RE_CODE_EXAMPLE.sub(insert_code_example, description)
     desc_split = description.split("<p>Code Examples</p>")
     description = desc_split[0].strip()
     # Get code examples.
@@ -101,6 +187,54 @@ def get_description_and_code_examples(description: str) -> Tuple[str, str]:
     return description, code_examples
 
 
+def get_text(e: Element) -> str:
+    """
+    :param e: An XML element.
+
+    :return: The text of the element and all of its sub-elements.
+    """
+
+    return "".join(e.itertext())
+
+
+def is_plain_text(text: str) -> bool:
+    """
+    :param text: Markdown text.
+
+    :return: True if the text is a single line without any Markdown syntax, i.e. Markdown would only wrap it in a paragraph.
+    """
+
+    return len(text) > 0 and not text[0].isspace() and _MARKDOWN_CHARACTERS.isdisjoint(text) and \
+        _RE_MARKDOWN_BLOCK_START.match(text) is None
+
+
+def inline_markdown(text: str) -> str:
+    """
+    :param text: Markdown text.
+
+    :return: The text converted to HTML, without paragraph tags.
+    """
+
+    # Most field descriptions and parameter types are plain text, so there's no need to parse them.
+    if is_plain_text(text):
+        return text
+    return _RE_PARAGRAPH_TAG.sub("", _MARKDOWN.reset().convert(text))
+
+
+def paragraphs_markdown(text: str) -> str:
+    """
+    :param text: Markdown text.
+
+    :return: The text converted to HTML.
+    """
+
+    # Most descriptions are plain paragraphs, so there's no need to parse them.
+    paragraphs: List[str] = [paragraph for paragraph in text.split("\n\n") if paragraph != ""]
+    if all(is_plain_text(paragraph) for paragraph in paragraphs):
+        return "\n".join([f"<p>{paragraph}</p>" for paragraph in paragraphs])
+    return _MARKDOWN.reset().convert(text)
+
+
 def get_type(e: Element) -> str:
     """
     :param e: An XML element.
@@ -123,6 +257,8 @@ class EnumDef:
     A definition for an enum type.
     """
 
+    __slots__ = ("name", "namespace", "description", "values", "value_descriptions")
+
     def __init__(self, name: str, namespace: str, e: Element):
         """
         :param name: The name of the enum type.
@@ -140,36 +276,35 @@ class EnumDef:
             value_name: str = enum_value.find("name").text
             self.values.append(value_name)
             value_description_element: Element = enum_value.find("briefdescription")
-            value_description = ET.tostring(value_description_element, encoding="utf-8", method="text").decode().strip()
+            value_description = get_text(value_description_element).strip()
             if len(value_description) > 0:
                 self.value_descriptions[value_name] = value_description
 
     def html(self) -> str:
         # Get the header.
-        html = f"<h1>{self.name}</h1>\n\n"
-        html += f'<p class="subtitle">enum in {self.namespace}</p>\n\n'
+        html: List[str] = [f"<h1>{self.name}</h1>\n\n",
+                           f'<p class="subtitle">enum in {self.namespace}</p>\n\n']
         # Add the description.
-        description = self.description.replace("\n\n", "%%").replace("\n", "\n\n").replace("%%", "\n\n")
+        description = _RE_LINE_BREAK.sub("\n\n", self.description)
         description, code_examples = get_description_and_code_examples(description)
-        html += markdown(f'{description.strip()}\n\n')
+        html.append(paragraphs_markdown(f'{description.strip()}\n\n'))
         # There are no value descriptions.
         if len(self.value_descriptions) == 0:
-            table = "<table>\n\t<tr>\n\t\t<th><strong>Value</strong></th>\n\t</tr>\n"
+            html.append(_ENUM_VALUES_TABLE_HEADER)
             for value in self.values:
-                table += f"\t<tr>\n\t\t<th>{value}</th>\n\t</tr>\n"
+                html.append(f"\t<tr>\n\t\t<th>{value}</th>\n\t</tr>\n")
         else:
-            table = "<table>\n\t<tr>\n\t\t<th><strong>Value</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t</tr>\n"
+            html.append(_ENUM_DESCRIPTIONS_TABLE_HEADER)
             for value in self.values:
                 if value in self.value_descriptions:
                     value_description = self.value_descriptions[value]
                 else:
                     value_description = ""
-                table += f"\t<tr>\n\t\t<th>{value}</th>\n\t\t<th>{value_description}</th>\n\t</tr>\n"
-        table += "\n</table>"
-        html += table
+                html.append(f"\t<tr>\n\t\t<th>{value}</th>\n\t\t<th>{value_description}</th>\n\t</tr>\n")
+        html.append("\n</table>")
         if len(code_examples) > 0:
-            html += "\n\n" + code_examples
-        return html.strip()
+            html.append("\n\n" + code_examples)
+        return "".join(html).strip()
 
 
 class Field:
@@ -177,28 +312,32 @@ class Field:
     A field definition.
     """
 
+    __slots__ = ("name", "type", "readonly", "const", "description", "default_value", "static", "protection",
+                 "inherited_from")
+
     def __init__(self, e: Element):
         """
         :param e: The root XML element.
         """
 
         self.name: str = e.find("name").text
-        self.type: str = get_type(e.find("type"))
-        ty = e.find("type").text
-        self.readonly: bool = ty is not None and ty.startswith("readonly")
+        type_element: Element = e.find("type")
+        self.type: str = get_type(type_element)
+        self.readonly: bool = (type_element.text or "").startswith("readonly")
         self.type = self.type.replace("readonly", "").strip()
         if self.type.startswith("const"):
             self.const: bool = True
             self.type = self.type.split("const")[1].strip()
         else:
             self.const = False
-        self.description: str = markdown(get_description(e=e, is_paragraphs=False)).replace("<p>", "").replace("</p>", "")
+        self.description: str = inline_markdown(get_description(e=e, is_paragraphs=False))
         initializer: Element = e.find("initializer")
         self.default_value: str = ""
         if initializer is not None:
-            self.default_value = ET.tostring(initializer, encoding="utf-8", method="text").decode().split("=")[1].strip()
-        self.static: bool = e.attrib["static"] == "yes"
-        self.protection: str = e.attrib["prot"]
+            self.default_value = get_text(initializer).split("=")[1].strip()
+        attrib: Dict[str, str] = e.attrib
+        self.static: bool = attrib["static"] == "yes"
+        self.protection: str = attrib["prot"]
         self.inherited_from: str = ""
 
 
@@ -207,14 +346,17 @@ class Property(Field):
     A property definition.
     """
 
+    __slots__ = ("gettable", "settable")
+
     def __init__(self, e: Element):
         """
         :param e: The root XML element.
         """
 
         super().__init__(e=e)
-        self.gettable: bool = e.attrib["gettable"] == "yes"
-        self.settable: bool = e.attrib["settable"] == "yes"
+        attrib: Dict[str, str] = e.attrib
+        self.gettable: bool = attrib["gettable"] == "yes"
+        self.settable: bool = attrib["settable"] == "yes"
 
 
 class Parameter:
@@ -222,6 +364,8 @@ class Parameter:
     A function parameter.
     """
 
+    __slots__ = ("parameter_type", "name", "description")
+
     def __init__(self, parameter_type: str, name: str, description: str):
         """
         :param parameter_type: The parameter type.
@@ -239,6 +383,9 @@ class Method:
     A function definition.
     """
 
+    __slots__ = ("type", "name", "delegate", "description", "args_string", "static", "protection", "virtual",
+                 "constructor", "inherited_from", "parameters")
+
     def __init__(self, class_name: str, e: Element):
         """
         :param class_name: The class name. This is used to find constructors.
@@ -252,28 +399,26 @@ class Method:
         self.delegate: bool = "delegate" in self.type
         self.description = get_description(e, detailed_description=False, is_paragraphs=True)
         self.args_string: str = e.find("argsstring").text
-        self.static: bool = e.attrib["static"] == "yes"
-        self.protection: str = e.attrib["prot"]
-        self.virtual: bool = e.attrib["virt"] == "virtual"
+        attrib: Dict[str, str] = e.attrib
+        self.static: bool = attrib["static"] == "yes"
+        self.protection: str = attrib["prot"]
+        self.virtual: bool = attrib["virt"] == "virtual"
         self.constructor: bool = class_name == self.name
         self.inherited_from: str = ""
         parameters: Dict[str, str] = dict()
-        parameter_elements: List[Element] = e.findall("param")
-        for pe in parameter_elements:
+        for pe in e.iterfind("param"):
             parameter_type_element: Element = pe.find("type")
             parameter_ref_element: Element = parameter_type_element.find("ref")
             if parameter_ref_element is not None:
                 parameter_type = f"[`{parameter_ref_element.text}`]({parameter_ref_element.text}.html)"
             else:
                 parameter_type = parameter_type_element.text
-            parameters[pe.find("declname").text] = parameter_type
+            parameters[pe.findtext("declname")] = parameter_type
+        # Get the description of each parameter from the parameter list.
         parameter_descriptions: Dict[str, str] = dict()
-        detailed_description: Element = e.find("detaileddescription")
-        if detailed_description is not None:
-            ps: List[str] = ET.tostring(detailed_description, encoding="utf-8", method="text").decode().split("\n")
-            ps = [line for line in ps if len(line.strip()) > 0]
-            for i in range(0, len(ps), 2):
-                parameter_descriptions[ps[i]] = ps[i + 1]
+        for parameter_item in e.iterfind("detaileddescription/para/parameterlist[@kind='param']/parameteritem"):
+            parameter_descriptions[parameter_item.findtext("parameternamelist/parametername")] = \
+                get_text(parameter_item.find("parameterdescription")).strip()
         self.parameters: List[Parameter] = list()
         for pa in parameters:
             self.parameters.append(Parameter(name=pa,
@@ -285,26 +430,25 @@ class Method:
         :return: The HTML string of the method's documentation.
         """
 
-        text = f'<h3>{self.name}</h3>\n\n'
+        text: List[str] = [f'<h3>{self.name}</h3>\n\n']
         if self.constructor:
-            text += f"<p><code>public {self.name}{self.args_string}</code></p>\n\n"
+            text.append(f"<p><code>public {self.name}{self.args_string}</code></p>\n\n")
         elif self.static:
-            text += f"<p><code>public static {self.type} {self.name}{self.args_string}</code></p>\n\n"
+            text.append(f"<p><code>public static {self.type} {self.name}{self.args_string}</code></p>\n\n")
         else:
-            text += f"<p><code>public {self.type} {self.name}{self.args_string}</code></p>\n\n"
+            text.append(f"<p><code>public {self.type} {self.name}{self.args_string}</code></p>\n\n")
         if not self.constructor and len(self.description.strip()) > 0:
-            text += f'{markdown(self.description.strip())}\n\n'
+            text.append(f'{paragraphs_markdown(self.description.strip())}\n\n')
         # Add a mention re: inheritance.
         if self.inherited_from != "":
-            text += f'<p>Inherited from <a href="{self.inherited_from}.html"><code>{self.inherited_from}</code></a>.</p>\n\n'
+            text.append(f'<p>Inherited from <a href="{self.inherited_from}.html"><code>{self.inherited_from}</code></a>.</p>\n\n')
         if len(self.parameters) > 0:
-            table = "<table>\n\t<tr>\n\t\t<th><strong>Name</strong></th><th>\n\t\t<strong>Type</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t</tr>\n"
+            text.append(_PARAMETERS_TABLE_HEADER)
             for parameter in self.parameters:
-                t = markdown(parameter.parameter_type).replace("<p>", "").replace("</p>", "")
-                table += f"\t<tr>\n\t\t<th>{parameter.name}</th>\n\t\t<th>{t}</th>\n\t\t<th>{parameter.description}</th>\n\t</tr>"
-            table += "\n</table>"
-            text += table + "\n\n"
-        return text
+                t = inline_markdown(parameter.parameter_type)
+                text.append(f"\t<tr>\n\t\t<th>{parameter.name}</th>\n\t\t<th>{t}</th>\n\t\t<th>{parameter.description}</th>\n\t</tr>")
+            text.append("\n</table>\n\n")
+        return "".join(text)
 
 
 class Klass:
@@ -312,6 +456,9 @@ class Klass:
     A class definition.
     """
 
+    __slots__ = ("name", "namespace", "is_class", "abstract", "description", "public_static_fields", "public_fields",
+                 "public_static_methods", "public_methods", "properties", "inheritance")
+
     IGNORE_SECTIONS: List[str] = ["private-attrib", "protected-attrib", "protected-func", "private-static-attrib",
                                   "private-func", "private-static-func", "private-type"]
 
@@ -325,8 +472,9 @@ class Klass:
         self.name: str = name
         self.namespace: str = namespace
         cd: Element = et.find("compounddef")
-        self.is_class: bool = cd.attrib["id"].startswith("class")
-        self.abstract: bool = cd.attrib["abstract"] == "yes" if "abstract" in cd.attrib else False
+        cd_attrib: Dict[str, str] = cd.attrib
+        self.is_class: bool = cd_attrib["id"].startswith("class")
+        self.abstract: bool = cd_attrib.get("abstract") == "yes"
         self.description: str = get_description(e=cd, is_paragraphs=True)
         self.public_static_fields: List[Field] = list()
         self.public_fields: List[Field] = list()
@@ -356,24 +504,19 @@ class Klass:
         if self.is_class:
             inheritance_graph: Element = cd.find("inheritancegraph")
             if inheritance_graph is not None:
-                # Get my ID.
-                nodes = inheritance_graph.findall("node")
-                node_id: str = ""
-                for node in nodes:
-                    inheritance_name = node.find("label").text.split(".")[-1]
-                    if inheritance_name == self.name:
-                        node_id = node.attrib["id"]
-                        break
+                # Get the name, ID, and child node ID of each node.
+                nodes: List[Tuple[str, str, Optional[str]]] = list()
                 for node in inheritance_graph.findall("node"):
-                    inheritance_name = node.find("label").text.split(".")[-1]
-                    if inheritance_name == self.name:
-                        continue
-                    child_node = node.find("childnode")
-                    # Only add child nodes if this klass is the child.
-                    if child_node is not None and child_node.attrib["refid"] == node_id:
-                        continue
-                    if inheritance_name is not None:
-                        self.inheritance.append(inheritance_name)
+                    child_node: Element = node.find("childnode")
+                    nodes.append((node.find("label").text.split(".")[-1],
+                                  node.attrib["id"],
+                                  child_node.attrib["refid"] if child_node is not None else None))
+                # Get my ID.
+                node_id: str = next((inheritance_id for inheritance_name, inheritance_id, _ in nodes
+                                     if inheritance_name == self.name), "")
+                # Only add child nodes if this klass is the child.
+                self.inheritance.extend(inheritance_name for inheritance_name, _, child_node_id in nodes
+                                        if inheritance_name != self.name and child_node_id != node_id)
 
     def html(self) -> str:
         """
@@ -381,7 +524,7 @@ class Klass:
         """
 
         # Get the header.
-        html = f"<h1>{self.name}</h1>\n\n"
+        html: List[str] = [f"<h1>{self.name}</h1>\n\n"]
         # Get the subtitle.
         if self.is_class:
             if self.abstract:
@@ -390,62 +533,58 @@ class Klass:
                 member_type = "class"
         else:
             member_type = "struct"
-        html += f'<p class="subtitle">{member_type} in {self.namespace}</p>\n\n'
+        html.append(f'<p class="subtitle">{member_type} in {self.namespace}</p>\n\n')
         if len(self.inheritance) > 0:
-            inheritance_p = f'<p class="subtitle">Inherits from '
+            inheritance_links: List[str] = list()
             for inh in self.inheritance:
                 # Link out to Unity.
                 if inh == "MonoBehaviour":
-                    inheritance_p += f'<a href="https://docs.unity3d.com/ScriptReference/MonoBehaviour.html"><code>{inh}</code></a>, '
+                    inheritance_links.append(f'<a href="https://docs.unity3d.com/ScriptReference/MonoBehaviour.html"><code>{inh}</code></a>')
                 # This is a Clatter class.
                 else:
-                    inheritance_p += f'<a href="{inh}.html"><code>{inh}</code></a>, '
-            html += inheritance_p[:-2] + f'</p>\n\n'
+                    inheritance_links.append(f'<a href="{inh}.html"><code>{inh}</code></a>')
+            html.append(f'<p class="subtitle">Inherits from {", ".join(inheritance_links)}</p>\n\n')
         # Add the description.
-        description = self.description.replace("\n\n", "%%").replace("\n", "\n\n").replace("%%", "\n\n")
+        description = _RE_LINE_BREAK.sub("\n\n", self.description)
         description, code_examples = get_description_and_code_examples(description)
-        html += markdown(f'{description.strip()}\n\n')
+        html.append(paragraphs_markdown(f'{description.strip()}\n\n'))
         constants = [f for f in self.public_static_fields if f.const]
         static_fields = [f for f in self.public_static_fields if not f.const]
         delegates = [m for m in self.public_methods if m.delegate]
         public_methods = [m for m in self.public_methods if not m.delegate]
         # Add members.
         if len(constants) > 0:
-            html += f'<h2>Constants</h2>\n\n'
-            html += Klass.get_fields_table(fields=constants) + "\n\n"
+            html.append('<h2>Constants</h2>\n\n')
+            html.append(Klass.get_fields_table(fields=constants) + "\n\n")
         if len(static_fields) > 0:
-            html += f'<h2>Static Fields</h2>\n\n'
-            html += Klass.get_fields_table(fields=static_fields) + "\n\n"
+            html.append('<h2>Static Fields</h2>\n\n')
+            html.append(Klass.get_fields_table(fields=static_fields) + "\n\n")
         if len(self.public_fields) > 0:
-            html += f'<h2>Fields</h2>\n\n'
-            html += Klass.get_fields_table(fields=self.public_fields) + "\n\n"
+            html.append('<h2>Fields</h2>\n\n')
+            html.append(Klass.get_fields_table(fields=self.public_fields) + "\n\n")
         if len(self.properties) > 0:
-            html += f'<h2>Properties</h2>\n\n'
-            table = "<table>\n\t<tr>\n\t\t<th><strong>Name</strong></th><th>\n\t\t<strong>Type</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t\t<th><strong>Get/Set</strong></th>\n\t</tr>\n"
+            html.append('<h2>Properties</h2>\n\n')
+            html.append(_PROPERTIES_TABLE_HEADER)
             for field in self.properties:
                 get_set = []
                 if field.gettable:
                     get_set.append("get")
                 if field.settable:
                     get_set.append("set")
-                table += f"\t<tr>\n\t\t<th>{field.name}</th>\n\t\t<th>{field.type}</th>\n\t\t<th>{field.description}</th>\n\t\t<th>{' '.join(get_set)}</th>\n\t</tr>\n"
-            table += "\n</table>"
-            html += table + "\n\n"
+                html.append(f"\t<tr>\n\t\t<th>{field.name}</th>\n\t\t<th>{field.type}</th>\n\t\t<th>{field.description}</th>\n\t\t<th>{' '.join(get_set)}</th>\n\t</tr>\n")
+            html.append("\n</table>\n\n")
         if len(delegates) > 0:
-            html += f'<h2>Delegates</h2>\n\n'
-            for method in delegates:
-                html += method.html()
+            html.append('<h2>Delegates</h2>\n\n')
+            html.extend(method.html() for method in delegates)
         if len(self.public_static_methods) > 0:
-            html += f'<h2>Static Methods</h2>\n\n'
-            for method in self.public_static_methods:
-                html += method.html()
+            html.append('<h2>Static Methods</h2>\n\n')
+            html.extend(method.html() for method in self.public_static_methods)
         if len(public_methods) > 0:
-            html += f'<h2>Methods</h2>\n\n'
-            for method in public_methods:
-                html += method.html()
+            html.append('<h2>Methods</h2>\n\n')
+            html.extend(method.html() for method in public_methods)
         if len(code_examples) > 0:
-            html += "\n\n" + code_examples
-        return html.strip()
+            html.append("\n\n" + code_examples)
+        return "".join(html).strip()
 
     @staticmethod
     def get_fields_table(fields: List[Field]) -> str:
@@ -455,16 +594,18 @@ class Klass:
         :return: An HTML string of a table of fields.
         """
 
-        table = "<table>\n\t<tr>\n\t\t<th><strong>Name</strong></th><th>\n\t\t<strong>Type</strong></th>\n\t\t<th><strong>Description</strong></th>\n\t\t<th><strong>Default Value</strong></th>\n\t</tr>\n"
+        table: List[str] = [_FIELDS_TABLE_HEADER]
         for field in fields:
-            if field.readonly and not field.const and "Readonly." not in field.description:
-                field.description += " Readonly."
+            # Don't modify the field. Inherited fields are shallow copies that share their parent's description.
+            description: str = field.description
+            if field.readonly and not field.const and "Readonly." not in description:
+                description += " Readonly."
             # Add a mention re: inheritance.
             if field.inherited_from != "":
-                field.description += f' Inherited from <a href="{field.inherited_from}.html"><code>{field.inherited_from}</code></a>.\n\n'
-            table += f"\t<tr>\n\t\t<th>{field.name}</th>\n\t\t<th>{field.type}</th>\n\t\t<th>{field.description}</th>\n\t\t<th>{field.default_value}</th>\n\t</tr>\n"
-        table += "</table>"
-        return table
+                description += f' Inherited from <a href="{field.inherited_from}.html"><code>{field.inherited_from}</code></a>.\n\n'
+            table.append(f"\t<tr>\n\t\t<th>{field.name}</th>\n\t\t<th>{field.type}</th>\n\t\t<th>{description}</th>\n\t\t<th>{field.default_value}</th>\n\t</tr>\n")
+        table.append("</table>")
+        return "".join(table)
 
     @staticmethod
     def get_fields(e: Element) -> List[Field]:
@@ -481,7 +622,7 @@ class Klass:
             if member_kind == "variable":
                 fields.append(Field(member))
             else:
-                raise Exception(ET.tostring(e))
+                raise Exception(ET.tostring(e, encoding="unicode"))
         return fields
 
     @staticmethod
@@ -500,7 +641,7 @@ class Klass:
             if member_kind == "function":
                 methods.append(Method(class_name, member))
             else:
-                raise Exception(ET.tostring(e))
+                raise Exception(ET.tostring(e, encoding="unicode"))
         return methods
 
     @staticmethod
@@ -518,10 +659,11 @@ class Klass:
             if member_kind == "property":
                 properties.append(Property(member))
             else:
-                raise Exception(ET.tostring(e))
+                raise Exception(ET.tostring(e, encoding="unicode"))
         return properties
 
 
+@lru_cache(maxsize=None)
 def get_namespaces() -> Dict[str, List[str]]:
     """
     :return: A dictionary. Key = Namespace. Value = A list of names of classes in the namespace.
@@ -529,15 +671,13 @@ def get_namespaces() -> Dict[str, List[str]]:
 
     namespaces: Dict[str, List[str]] = dict()
     for namespace in ["Clatter.Core", "Clatter.Unity"]:
-        namespaces[namespace] = list()
-        src = Path(f"../Clatter/{namespace}").resolve()
-        for f in src.iterdir():
-            if f.suffix == ".cs":
-                namespaces[namespace].append(f.stem)
+        with scandir(str(_CLATTER_DIRECTORY.joinpath(namespace))) as entries:
+            namespaces[namespace] = [entry.name[:-3] for entry in entries if entry.name.endswith(".cs") and entry.is_file()]
     return namespaces
 
 
 def get_mobile_menu() -> str:
+    namespaces = get_namespaces()
     mobile_menu = []
     for namespace in namespaces:
         # Add a title.
@@ -559,79 +699,91 @@ def get_sidebar() -> str:
     :return: The HTML for the sidebar div.
     """
 
-    sidebar = '<div class="sidepanel">\n'
-    sidebar += '\t\t\t\t<a class="title" href="index.html">Overview</a>\n\n'
-    sidebar += f'\n\t\t\t\t<div class="divider left"></div>\n\n'
+    namespaces = get_namespaces()
+    sidebar: List[str] = ['<div class="sidepanel">\n',
+                          '\t\t\t\t<a class="title" href="index.html">Overview</a>\n\n',
+                          '\n\t\t\t\t<div class="divider left"></div>\n\n']
     for namespace in namespaces:
         # Add a title.
         ns_lower = namespace.lower()
-        sidebar += f'\t\t\t\t<a class="title" href="{ns_lower}_overview.html">{namespace}</a>\n\n'
+        sidebar.append(f'\t\t\t\t<a class="title" href="{ns_lower}_overview.html">{namespace}</a>\n\n')
         # Add a link to each file.
-        for f in namespaces[namespace]:
-            sidebar += f'\t\t\t\t<a class="section" href="{f}.html">{f}</a>\n'
-        sidebar += f'\n\t\t\t\t<div class="divider left"></div>\n\n'
-    sidebar += '\t\t\t\t<a class="title" href="cli_overview.html">Clatter CLI</a>\n\n'
-    sidebar += f'\n\t\t\t\t<div class="divider left"></div>\n\n'
-    sidebar += '\t\t\t\t<a class="title" href="benchmark.html">Benchmark</a>\n\n'
-    sidebar = f"\t\t{sidebar.strip()}\n\t\t\t</div>"
-    return sidebar
+        sidebar.extend(f'\t\t\t\t<a class="section" href="{f}.html">{f}</a>\n' for f in namespaces[namespace])
+        sidebar.append('\n\t\t\t\t<div class="divider left"></div>\n\n')
+    sidebar.append('\t\t\t\t<a class="title" href="cli_overview.html">Clatter CLI</a>\n\n')
+    sidebar.append('\n\t\t\t\t<div class="divider left"></div>\n\n')
+    sidebar.append('\t\t\t\t<a class="title" href="benchmark.html">Benchmark</a>\n\n')
+    return f"\t\t{''.join(sidebar).strip()}\n\t\t\t</div>"
 
 
+@lru_cache(maxsize=None)
 def get_html_prefix() -> str:
     """
     :return: The prefix string for an HTML page.
     """
 
     q = Path("html_prefix.txt").read_text(encoding="utf-8")
-    q = q.replace("MOBILE_MENU", mobile_menu)
-    q += sidebar + '\n\t\t<div class="right-col">\n\n'
+    q = q.replace("MOBILE_MENU", get_mobile_menu())
+    q += get_sidebar() + '\n\t\t<div class="right-col">\n\n'
     return q
 
 
-def get_html_suffix() -> str:
+def get_overview_html(md: str, tables: bool = False) -> str:
     """
-    :return: The suffix of an HTML page.
+    :param md: The Markdown text of an overview document.
+    :param tables: If True, convert Markdown tables.
+
+    :return: The text converted to HTML. The HTML is cached between runs.
     """
 
-    return "</div></div></div></body></html>"
+    key: str = sha256(bytes([tables]) + md.encode("utf-8")).hexdigest()[:16]
+    cache_path: Path = get_cache_directory().joinpath(key + ".html")
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+    html: str = (_MARKDOWN_TABLES if tables else _MARKDOWN).reset().convert(md)
+    write_cache_file(path=cache_path, data=html.encode("utf-8"))
+    return html
 
 
+@lru_cache(maxsize=None)
 def get_clatter_core_overview() -> str:
     """
     :return: The HTML for the Clatter.Core overview doc.
     """
 
     version = get_version()
-    text: str = markdown(Path(f"clatter.core.md").resolve().read_text(encoding="utf-8"))
+    text: str = get_overview_html(Path("clatter.core.md").read_text(encoding="utf-8"))
     # Add the download links.
     downloads = '\n\n<p><strong>Download:</strong></p>\n\n'
     downloads += f'<p><a href="https://github.com/alters-mit/clatter/releases/download/{version}/Clatter.Core.dll">Clatter.Core.dll</a></p>'
     text = text.replace("<p>[URLS]</p>", downloads)
-    return get_html_prefix() + text + get_html_suffix()
+    return get_html_prefix() + text + _HTML_SUFFIX
 
 
+@lru_cache(maxsize=None)
 def get_clatter_unity_overview() -> str:
     """
     :return: The HTML for the Clatter.Core overview doc.
     """
 
     version = get_version()
-    text: str = markdown(Path(f"clatter.unity.md").resolve().read_text(encoding="utf-8"))
+    text: str = get_overview_html(Path("clatter.unity.md").read_text(encoding="utf-8"))
     # Add the download links.
     downloads = '\n\n<p><strong>Download:</strong></p>\n\n'
     downloads += f'<p><a href="https://github.com/alters-mit/clatter/releases/download/{version}/Clatter.Core.dll">Clatter.Core.dll</a>&emsp;'
     downloads += f'<a href="https://github.com/alters-mit/clatter/releases/download/{version}/Clatter.Unity.dll">Clatter.Unity.dll</a>'
     downloads += "</p>"
     text = text.replace("<p>[URLS]</p>", downloads)
-    return get_html_prefix() + text + get_html_suffix()
+    return get_html_prefix() + text + _HTML_SUFFIX
 
 
+@lru_cache(maxsize=None)
 def get_readme() -> str:
     """
     :return: The HTML for the overall overview document.
     """
 
-    md: str = Path("overview.md").resolve().read_text(encoding="utf-8")
+    md: str = Path("overview.md").read_text(encoding="utf-8")
     downloads = '\n\n<p><strong>Download:</strong>&emsp;\n\n'
     version = get_version()
     downloads += f'<a href="https://github.com/alters-mit/clatter/releases/download/{version}/Clatter.Core.dll">Clatter.Core.dll</a>&emsp;'
@@ -640,28 +792,39 @@ def get_readme() -> str:
     for platform, exe in zip(["Linux", "OSX", "Windows"], ["clatter_linux.tar.gz", "clatter_osx.tar.gz", "clatter_windows.zip"]):
         downloads += f'<a href="https://github.com/alters-mit/clatter/releases/download/{version}/{exe}">{platform}</a>&emsp;'
     downloads += "</p>"
-    readme_html = get_html_prefix() + markdown(md) + get_html_suffix()
+    readme_html = get_html_prefix() + get_overview_html(md) + _HTML_SUFFIX
     readme_html = readme_html.replace("<p>[URLS]</p>", downloads)
     return readme_html
 
 
+@lru_cache(maxsize=None)
 def get_benchmark() -> str:
     """
     :return: The HTML for the benchmark document.
     """
 
     md = Path("benchmark.md").read_text()
-    return get_html_prefix() + markdown(md, extensions=['markdown.extensions.tables']) + get_html_suffix()
+    return get_html_prefix() + get_overview_html(md, tables=True) + _HTML_SUFFIX
 
 
 def doxygen() -> None:
     """
-    Call doxygen to generate XML document files.
+    Call doxygen to generate XML document files, unless they are newer than the Doxyfile and the source files.
+    The XML is kept between runs so that reruns without source changes skip Doxygen.
     """
 
+    index = _XML_DIRECTORY.joinpath("index.xml")
+    if index.exists():
+        xml_time = index.stat().st_mtime
+        # These are the Doxyfile's input directories.
+        if Path("Doxyfile").stat().st_mtime < xml_time and \
+                all(f.stat().st_mtime < xml_time for directory in ["Clatter.Core", "Clatter.Unity"]
+                    for f in _CLATTER_DIRECTORY.joinpath(directory).rglob("*.cs")):
+            return
     call("doxygen", stdout=DEVNULL)
 
 
+@lru_cache(maxsize=None)
 def snake_case(camel_case: str) -> str:
     """
     :param camel_case: A CamelCase string.
@@ -670,27 +833,123 @@ def snake_case(camel_case: str) -> str:
     """
 
     # Source: https://stackoverflow.com/a/1176023
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', camel_case).lower()
+    return _RE_SNAKE.sub('_', camel_case).lower()
+
+
+@lru_cache(maxsize=None)
+def get_source_hash() -> bytes:
+    """
+    :return: The hash of this script, the Markdown version, and the XML parser. Cached classes and HTML are invalid if any of these change.
+    """
+
+    return sha256(Path(__file__).read_bytes() + f"{markdown_version} {ET.__name__}".encode("utf-8")).digest()
+
+
+@lru_cache(maxsize=None)
+def get_cache_directory() -> Path:
+    """
+    :return: The cache directory for the current source hash.
+    """
+
+    return _CACHE_DIRECTORY.joinpath(get_source_hash().hex()[:16])
+
+
+def prune_cache() -> None:
+    """
+    Create the cache directory for the current source hash and remove caches made with any other source hash.
+    """
+
+    cache_directory = get_cache_directory()
+    if _CACHE_DIRECTORY.exists():
+        for f in _CACHE_DIRECTORY.iterdir():
+            if f.is_dir():
+                if f != cache_directory:
+                    rmtree(f)
+            else:
+                f.unlink()
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+
+def write_cache_file(path: Path, data: bytes) -> None:
+    """
+    Write a file to the cache directory, creating the directory if needed.
+    The data is written to a temporary file first so that an interrupted run can't leave a partial cache file.
+
+    :param path: The path to the cache file.
+    :param data: The file data.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path: Path = path.with_suffix(".tmp")
+    temp_path.write_bytes(data)
+    temp_path.replace(path)
+
+
+def get_cache_key(name: str, namespace: str, xml: bytes) -> str:
+    """
+    :param name: The name of the class.
+    :param namespace: The namespace of the class.
+    :param xml: The class's XML file.
+
+    :return: The filename (without a suffix) of the cached class.
+    """
+
+    return sha256(f"{namespace}.{name}".encode("utf-8") + xml).hexdigest()[:16]
+
+
+def get_file_member(path: Path) -> Element:
+    """
+    Parse a file's XML until its first inner class or section. Doxygen lists these before the file's source code, which isn't parsed.
+
+    :param path: The path to the file's XML.
+
+    :return: The first `innerclass` or `sectiondef` element.
+    """
+
+    with path.open("rb") as f:
+        for event, element in ET.iterparse(f, events=("end", )):
+            if element.tag == "innerclass" or element.tag == "sectiondef":
+                return element
+    raise Exception(f"No inner class or section in: {path}")
 
 
 def get_klass(name: str, namespace: str) -> Union[Klass, EnumDef]:
-    d = Path("xml")
     # Get the filename from the 8cs file.
-    root = ET.parse(d.joinpath(f"_{snake_case(name)}_8cs.xml").resolve().absolute())
-    compound_def: Element = root.find("compounddef")
-    inner_class: Element = compound_def.find("innerclass")
-    if inner_class is not None:
-        filename: str = inner_class.attrib["refid"] + ".xml"
+    file_member: Element = get_file_member(_XML_DIRECTORY.joinpath(f"_{snake_case(name)}_8cs.xml"))
+    if file_member.tag == "innerclass":
+        filename: str = file_member.attrib["refid"] + ".xml"
         # Load the actual file.
-        root: ElementTree = ET.parse(d.joinpath(filename).resolve().absolute())
-        return Klass(name=name, namespace=namespace, et=root)
+        xml: bytes = _XML_DIRECTORY.joinpath(filename).read_bytes()
+        # If this class hasn't changed since a previous run, load it from the cache.
+        cache_path: Path = get_cache_directory().joinpath(get_cache_key(name=name, namespace=namespace, xml=xml) + ".pickle")
+        if cache_path.exists():
+            try:
+                return pickle.loads(cache_path.read_bytes())
+            # The cached class can't be loaded, e.g. if it was pickled by a process with a different start method.
+            except (pickle.UnpicklingError, AttributeError, EOFError):
+                pass
+        # The class doesn't keep any XML elements, so the tree is freed when this returns.
+        klass = Klass(name=name, namespace=namespace, et=ET.ElementTree(ET.fromstring(xml)))
+        write_cache_file(path=cache_path, data=pickle.dumps(klass))
+        return klass
+    # This is an enum.
+    elif file_member.attrib["kind"] == "enum":
+        return EnumDef(name=name, namespace=namespace, e=file_member)
     else:
-        section_def: Element = compound_def.find("sectiondef")
-        # This is an enum.
-        if section_def.attrib["kind"] == "enum":
-            return EnumDef(name=name, namespace=namespace, e=section_def)
-        else:
-            raise Exception(ET.tostring(compound_def).decode())
+        raise Exception(ET.tostring(file_member, encoding="unicode"))
+
+
+def copy_inherited(member: Union[Field, Method], parent_class_name: str) -> Union[Field, Method]:
+    """
+    :param member: A field, property, or method of a parent class.
+    :param parent_class_name: The name of the parent class.
+
+    :return: A shallow copy of the member, marked as inherited from the parent class.
+    """
+
+    inherited = copy(member)
+    inherited.inherited_from = parent_class_name
+    return inherited
 
 
 def inherit_fields(parent_class_name: str, child_fields: List[Field], parent_fields: List[Field]) -> List[Field]:
@@ -704,10 +963,7 @@ def inherit_fields(parent_class_name: str, child_fields: List[Field], parent_fie
     :return: The list of the child class's fields, including inherited methods.
     """
 
-    for field in parent_fields:
-        fi = copy(field)
-        fi.inherited_from = parent_class_name
-        child_fields.append(fi)
+    child_fields.extend(copy_inherited(field, parent_class_name) for field in parent_fields)
     return child_fields
 
 
@@ -722,27 +978,26 @@ def inherit_methods(parent_class_name: str, child_methods: List[Method], parent_
     :return: The list of the child class's methods, including inherited methods.
     """
 
-    # Get a list of existing method names.
-    method_names = [m.name for m in child_methods]
+    # Get the first existing method per name.
+    child_methods_by_name: Dict[str, Method] = dict()
+    for method in child_methods:
+        child_methods_by_name.setdefault(method.name, method)
     for method in parent_methods:
         # If a method by the same name already exists, it means we've overridden a method.
-        if method.name in method_names:
+        if method.name in child_methods_by_name:
             # Mark the overridden method as inherited.
-            for q in range(len(child_methods)):
-                if child_methods[q].name == method.name:
-                    child_methods[q].inherited_from = parent_class_name
-                    break
+            child_methods_by_name[method.name].inherited_from = parent_class_name
             continue
         # Copy the inherited method.
-        me = copy(method)
-        me.inherited_from = parent_class_name
-        child_methods.append(me)
+        child_methods.append(copy_inherited(method, parent_class_name))
     return child_methods
 
 
-def class_inheritance() -> None:
+def class_inheritance(klasses: Dict[str, Klass]) -> None:
     """
-    Copy inherited fields and methods into child classes and generate documentation.
+    Copy inherited fields and methods into child classes.
+
+    :param klasses: All classes in a namespace. Key = The class name.
     """
 
     # Figure out inheritance.
@@ -768,38 +1023,47 @@ def class_inheritance() -> None:
                                                                  child_methods=klasses[klass_name].public_methods,
                                                                  parent_methods=parent_klass.public_methods)
             # Copy the properties.
-            for parent_property in parent_klass.properties:
-                pr = copy(parent_property)
-                pr.inherited_from = parent_klass.name
-                klasses[klass_name].properties.append(pr)
-        # Generate the doc.
-        klass_html = klasses[klass_name].html()
-        klass_html = get_html_prefix() + klass_html + get_html_suffix()
-        dst.joinpath(klass_name + ".html").write_text(klass_html)
+            klasses[klass_name].properties.extend(copy_inherited(parent_property, parent_klass.name)
+                                                  for parent_property in parent_klass.properties)
+
+
+def write_klass_html(klass: Union[Klass, EnumDef], dst: Path, html_prefix: str) -> None:
+    """
+    Write the HTML document of a type.
+
+    :param klass: A class, struct, or enum definition.
+    :param dst: The output directory.
+    :param html_prefix: The HTML page prefix.
+    """
 
+    dst.joinpath(klass.name + ".html").write_text(html_prefix + klass.html() + _HTML_SUFFIX)
 
+
+@lru_cache(maxsize=None)
 def get_cli() -> str:
     """
     :return: The HTML for the CLI documentation.
     """
 
     version = get_version()
-    text: str = markdown(Path("cli.md").resolve().read_text(encoding="utf-8").replace("powershell", ""))
+    text: str = get_overview_html(Path("cli.md").read_text(encoding="utf-8").replace("powershell", ""))
     # Add the download links.
     downloads = '\n\n<p><strong>Download:</strong></p>\n\n<p>'
     for platform, exe in zip(["Linux", "OSX", "Windows"], ["clatter_linux.tar.gz", "clatter_osx.tar.gz", "clatter_windows.zip"]):
         downloads += f'<a href="https://github.com/alters-mit/clatter/releases/download/{version}/{exe}">{platform}</a>&emsp;'
     downloads += "</p>"
     text = text.replace("<p>[URLS]</p>", downloads)
-    text = re.sub(r'<p><code>(.*?)</code></p>', r'<p><pre><code>\1</code></pre></p>', text, flags=re.MULTILINE)
+    text = _RE_CLI_CODE.sub(r'<p><pre><code>\1</code></pre></p>', text)
     # Fix the Python example.
-    text = re.sub(r'```python\n((.|\n)*?)```', r'<pre><code>\1</pre></code', text, flags=re.MULTILINE)
-    return get_html_prefix() + text.strip() + get_html_suffix()
+    text = _RE_CLI_PYTHON.sub(r'<pre><code>\1</pre></code', text)
+    return get_html_prefix() + text.strip() + _HTML_SUFFIX
 
 
-def images() -> None:
+def images(dst: Path) -> None:
     """
     Copy all images.
+
+    :param dst: The output directory.
     """
 
     images_src_directory = Path("images")
@@ -811,48 +1075,46 @@ def images() -> None:
             copyfile(src=str(f), dst=str(images_dst_directory.joinpath(f.name)))
 
 
-# Generate XML with Doxygen.
-doxygen()
-# Get the namespaces.
-namespaces = get_namespaces()
-# Get the sidebar html.
-sidebar = get_sidebar()
-mobile_menu = get_mobile_menu()
-dst = Path.home().joinpath("alters-mit.github.io/clatter").resolve()
-# Remove the existing docs.
-for f in dst.iterdir():
-    if f.is_file() and f.suffix == ".html":
-        f.unlink()
-# Write the overview doc.
-dst.joinpath("index.html").write_text(get_readme())
-# Add the overview docs.
-dst.joinpath("cli_overview.html").write_text(get_cli())
-dst.joinpath("benchmark.html").write_text(get_benchmark())
-dst.joinpath("clatter.core_overview.html").write_text(get_clatter_core_overview())
-dst.joinpath("clatter.unity_overview.html").write_text(get_clatter_unity_overview())
-# Add the API docs.
-for ns in namespaces:
-    # Generate class, struct, and enum docs.
-    klasses: Dict[str, Klass] = dict()
-    for kl in namespaces[ns]:
-        klass = get_klass(name=kl, namespace=ns)
-        if isinstance(klass, Klass):
-            # Append this class to review class inheritance later.
-            if klass.is_class:
-                klasses[klass.name] = klass
-            # This is a struct. Generate the doc.
-            else:
-                html = klass.html()
-                html = get_html_prefix() + html + get_html_suffix()
-                dst.joinpath(klass.name + ".html").write_text(html)
-        # This is an enum. Generate the doc.
-        elif isinstance(klass, EnumDef):
-            html = klass.html()
-            html = get_html_prefix() + html + get_html_suffix()
-            dst.joinpath(klass.name + ".html").write_text(html)
-    # Figure out inheritance.
-    class_inheritance()
-# Remove the XML.
-rmtree(Path("xml").absolute())
-# Copy the images.
-images()
+def main() -> None:
+    """
+    Generate the documentation.
+    """
+
+    # Generate XML with Doxygen.
+    doxygen()
+    # Get the namespaces.
+    namespaces = get_namespaces()
+    dst = Path.home().joinpath("alters-mit.github.io/clatter").resolve()
+    prune_cache()
+    # Remove the existing docs.
+    for f in dst.iterdir():
+        if f.is_file() and f.suffix == ".html":
+            f.unlink()
+    # Write the overview doc.
+    dst.joinpath("index.html").write_text(get_readme())
+    # Add the overview docs.
+    dst.joinpath("cli_overview.html").write_text(get_cli())
+    dst.joinpath("benchmark.html").write_text(get_benchmark())
+    dst.joinpath("clatter.core_overview.html").write_text(get_clatter_core_overview())
+    dst.joinpath("clatter.unity_overview.html").write_text(get_clatter_unity_overview())
+    # Add the API docs. Each class, struct, and enum is parsed and rendered in a separate process.
+    with ProcessPoolExecutor() as executor:
+        for ns in namespaces:
+            klasses: Dict[str, Klass] = dict()
+            docs: List[Union[Klass, EnumDef]] = list()
+            for klass in executor.map(get_klass, namespaces[ns], repeat(ns)):
+                # Append this class to review class inheritance later.
+                if isinstance(klass, Klass) and klass.is_class:
+                    klasses[klass.name] = klass
+                docs.append(klass)
+            # Figure out inheritance.
+            class_inheritance(klasses=klasses)
+            # Generate and write class, struct, and enum docs.
+            # Build the HTML prefix once in this process and pass it to the workers.
+            list(executor.map(write_klass_html, docs, repeat(dst), repeat(get_html_prefix())))
+    # Copy the images.
+    images(dst=dst)
+
+
+if __name__ == "__main__":
+    main()
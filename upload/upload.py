@@ -1,20 +1,41 @@
-from os import getcwd, chdir
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 import tarfile
 from zipfile import ZipFile
 import re
 from subprocess import call
 from pathlib import Path
-from github import Github, Repository
+from tempfile import TemporaryDirectory
+from typing import Dict, List
+from github import Github, Repository, UnknownObjectException
 from github.GitRelease import GitRelease
 
 
+_RE_ASSEMBLY_VERSION = re.compile(r'^\[assembly: AssemblyVersion\("(.*?)"\)\]', flags=re.MULTILINE)
+# Each version's changelog ends at the next version's header.
+_RE_CHANGELOG = re.compile(r"^# (?P<version>[^\n]+)\n(?P<changelog>.*?)(?=^# )", flags=re.MULTILINE | re.DOTALL)
+# The maximum number of concurrent asset uploads. There are five assets per release.
+_MAX_UPLOADS = 5
+
+
 def get_version() -> str:
     """
     :return: The version number of Clatter.Core.
     """
 
     assembly_info: str = Path("../Clatter/Clatter.Core/Properties/AssemblyInfo.cs").read_text(encoding="utf-8")
-    return re.search(r'^\[assembly: AssemblyVersion\("(.*?)"\)\]', assembly_info, flags=re.MULTILINE).group(1)
+    return _RE_ASSEMBLY_VERSION.search(assembly_info).group(1)
+
+
+@lru_cache(maxsize=1)
+def get_changelogs() -> Dict[str, str]:
+    """
+    :return: A dictionary of changelogs. Key = The version. Value = The changelog for that version.
+    """
+
+    return {match.group("version").strip(): match.group("changelog").strip()
+            for match in _RE_CHANGELOG.finditer(Path("../changelog.md").read_text(encoding="utf-8"))}
 
 
 def get_changelog(version: str) -> str:
@@ -24,13 +45,54 @@ def get_changelog(version: str) -> str:
     :return: The changelog for this version.
     """
 
-    s = re.search("(# " + version.replace(".", r"\.") + r"((.|\n)*?))^# ",
-                  Path("../changelog.md").read_text(encoding="utf-8"),
-                  flags=re.MULTILINE)
-    if s is None:
-        return "Initial release."
-    else:
-        return s.group(2).strip()
+    return get_changelogs().get(version, "Initial release.")
+
+
+def tar_executable(exe_directory: Path, tar_path: Path) -> Path:
+    """
+    Tar a UNIX CLI executable.
+
+    :param exe_directory: The directory of the executable.
+    :param tar_path: The path to the tarball.
+
+    :return: The path to the tarball.
+    """
+
+    with tarfile.open(name=str(tar_path), mode="w:gz") as f:
+        f.add(str(exe_directory.joinpath("clatter")), arcname="clatter")
+    return tar_path
+
+
+def zip_executable(exe_directory: Path, zip_path: Path) -> Path:
+    """
+    Zip the Windows CLI executable.
+
+    :param exe_directory: The directory of the executable.
+    :param zip_path: The path to the zip file.
+
+    :return: The path to the zip file.
+    """
+
+    with ZipFile(str(zip_path), "w") as f:
+        f.write(str(exe_directory.joinpath("clatter.exe")), "clatter.exe")
+    return zip_path
+
+
+def upload_asset(release: GitRelease, path: Path, content_type: str) -> str:
+    """
+    Upload a file to a release.
+
+    :param release: The release.
+    :param path: The path to the file.
+    :param content_type: The content type of the file.
+
+    :return: The name of the uploaded file.
+    """
+
+    release.upload_asset(path=str(path),
+                         name=path.name,
+                         content_type=content_type)
+    return path.name
 
 
 def upload_github_release() -> None:
@@ -44,55 +106,46 @@ def upload_github_release() -> None:
     token_path = Path("github_auth.txt")
     assert token_path.exists(), "GitHub token not found. You must have a valid token save to github_auth.txt"
     token: str = token_path.read_text(encoding="utf-8").strip()
-    repo: Repository = Github(token).get_repo("alters-mit/clatter")
-    # Make sure this is a new release.
-    for release in repo.get_releases():
-        if release.title == version:
-            raise Exception(f"Release {version} already exists.")
-    release: GitRelease = repo.create_git_release(tag=version,
-                                                  name=version,
-                                                  message=get_changelog(version=version),
-                                                  target_commitish="main")
-    print(f"Created release: {version}")
+    # Allow one connection per concurrent asset upload.
+    repo: Repository = Github(token, pool_size=_MAX_UPLOADS).get_repo("alters-mit/clatter")
+    # Make sure this is a new release. Releases are tagged with their version.
+    try:
+        repo.get_release(version)
+        raise Exception(f"Release {version} already exists.")
+    except UnknownObjectException:
+        pass
     # Get the paths.
     root_src_path: Path = Path("../Clatter/").absolute().resolve()
     clatter_cli_directory: Path = root_src_path.joinpath("Clatter.CommandLine/bin/Release/net7.0")
     clatter_cli_linux_path: Path = clatter_cli_directory.joinpath("linux-x64/publish").resolve()
     clatter_cli_osx_path: Path = clatter_cli_directory.joinpath("osx-x64/publish").resolve()
     clatter_cli_win_path: Path = clatter_cli_directory.joinpath("win-x64/publish").resolve()
-    cwd = getcwd()
-    # Upload the UNIX CLI executables.
-    for exe_path, platform in zip([clatter_cli_linux_path, clatter_cli_osx_path], ["linux", "osx"]):
-        chdir(str(exe_path))
-        tar_name = f"clatter_{platform}.tar.gz"
-        # Tar.
-        with tarfile.open(name=tar_name, mode="w|gz") as f:
-            f.add("clatter")
-        chdir(cwd)
-        tar_path = exe_path.joinpath(tar_name)
-        # Upload.
-        release.upload_asset(path=str(tar_path),
-                             name=tar_name,
-                             content_type="application/gzip")
-        print(f"Uploaded: {tar_name}")
-    # Upload the Windows CLI executable.
-    chdir(str(clatter_cli_win_path))
-    with ZipFile("clatter_windows.zip", "w") as f:
-        f.write("clatter.exe", "clatter.exe")
-    chdir(cwd)
-    zip_path = clatter_cli_win_path.joinpath("clatter_windows.zip").absolute()
-    release.upload_asset(path=str(zip_path),
-                         name="clatter_windows.zip",
-                         content_type="application/gzip")
-    print(f"Uploaded: clatter_windows.zip")
-    # Upload the DLLs.
     clatter_core_path: Path = root_src_path.joinpath("Clatter.Core/bin/Release/Clatter.Core.dll").resolve()
     clatter_unity_path: Path = root_src_path.joinpath("Clatter.Unity/bin/Release/Clatter.Unity.dll").resolve()
     for dll_path in [clatter_core_path, clatter_unity_path]:
-        release.upload_asset(path=str(dll_path),
-                             name=dll_path.name,
-                             content_type="application/x-dosexec")
-        print(f"Uploaded: {dll_path}")
+        assert dll_path.exists(), f"DLL not found: {dll_path}"
+    # Package everything before creating the release so that a packaging error doesn't leave an incomplete release.
+    with TemporaryDirectory() as temp_directory:
+        archive_directory = Path(temp_directory)
+        # Tar the UNIX CLI executables and zip the Windows CLI executable.
+        with ThreadPoolExecutor() as executor:
+            archives = [executor.submit(tar_executable, clatter_cli_linux_path, archive_directory.joinpath("clatter_linux.tar.gz")),
+                        executor.submit(tar_executable, clatter_cli_osx_path, archive_directory.joinpath("clatter_osx.tar.gz")),
+                        executor.submit(zip_executable, clatter_cli_win_path, archive_directory.joinpath("clatter_windows.zip"))]
+            asset_paths: List[Path] = [archive.result() for archive in archives]
+        content_types: List[str] = ["application/gzip", "application/gzip", "application/gzip"]
+        # Add the DLLs.
+        asset_paths.extend([clatter_core_path, clatter_unity_path])
+        content_types.extend(["application/x-dosexec", "application/x-dosexec"])
+        release: GitRelease = repo.create_git_release(tag=version,
+                                                      name=version,
+                                                      message=get_changelog(version=version),
+                                                      target_commitish="main")
+        print(f"Created release: {version}")
+        # Upload the files in parallel.
+        with ThreadPoolExecutor(max_workers=_MAX_UPLOADS) as executor:
+            for name in executor.map(upload_asset, repeat(release), asset_paths, content_types):
+                print(f"Uploaded: {name}")
 
 
 if __name__ == "__main__":